@@ -112,15 +112,15 @@ def launch_cli() -> int:
             return 1
         preset = picked_preset
 
-    ollama_client = OllamaClient()
-    try:
-        model_names = ollama_client.list_models()
-    except Exception:
-        model_names = []
-        questionary.print(
-            "Could not read models from `ollama list` API. Falling back to manual input.",
-            style="fg:#f59e0b",
-        )
+    with OllamaClient() as ollama_client:
+        try:
+            model_names = ollama_client.list_models()
+        except Exception:
+            model_names = []
+            questionary.print(
+                "Could not read models from `ollama list` API. Falling back to manual input.",
+                style="fg:#f59e0b",
+            )
 
     llm_model = _ask_model_from_ollama("Choose LLM model", "mistral-large-3:675b-cloud", model_names)
     report_language = questionary.select(
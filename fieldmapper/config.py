@@ -14,6 +14,15 @@ class PipelineConfig:
     write_model_tagged_report: bool = True
     write_report_bib: bool = True
     similarity_threshold: float = 0.82
+    theory_speculative_retry: bool = False
+    theory_cache_dir: Path | None = None
+    synthesis_parallel_requests: int = 1
+    synthesis_cross_revise: bool = False
+    synthesis_overlap_sections: bool = False
+    # One call for all eight sections: prompt and full reply must fit in the model's num_ctx,
+    # so raise it (Modelfile PARAMETER num_ctx or OLLAMA_CONTEXT_LENGTH) before enabling this
+    synthesis_batched: bool = False
+    section_cache_dir: Path | None = None
     max_intro_chars: int = 9000
     max_discussion_chars: int = 9000
     max_abstract_chars: int = 4000
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+
+def llm_cache_path(cache_dir: Path, *parts: str) -> Path:
+    """Content-addressed cache file for one LLM reply: the same key parts map to the same file."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return cache_dir / f"{digest.hexdigest()}.txt"
@@ -1,37 +1,108 @@
 from __future__ import annotations
 
+import json
+from collections.abc import Iterator
+
 import requests
+from requests.adapters import HTTPAdapter
+
+# Keep-alive connections kept per host; covers every section running in parallel
+OLLAMA_POOL_SIZE = 16
 
 
 class OllamaClient:
+    """Thin Ollama HTTP client.
+
+    Holds one long-lived ``requests.Session`` so the sequential per-section calls
+    made by the synthesis and rewrite stages reuse a keep-alive connection instead
+    of paying a fresh TCP handshake each time. The session is shared by the
+    parallel synthesis threads (calls keep no per-request state on the client), and
+    its pool is sized so concurrent calls each keep their connection alive rather
+    than overflowing requests' default of 10. Use as a context manager (or call
+    ``close()``) to release the pooled connections.
+    """
+
     def __init__(self, base_url: str = "http://127.0.0.1:11434") -> None:
         self.base_url = base_url.rstrip("/")
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=OLLAMA_POOL_SIZE, pool_maxsize=OLLAMA_POOL_SIZE)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
-    def chat(
-        self,
+    def close(self) -> None:
+        self._session.close()
+
+    def __enter__(self) -> OllamaClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @staticmethod
+    def _chat_payload(
         model: str,
         system: str,
         user: str,
-        temperature: float = 0.0,
-        timeout: int = 1800,
-    ) -> str:
-        payload = {
+        temperature: float,
+        stream: bool,
+        num_predict: int | None = None,
+    ) -> dict:
+        options: dict[str, float | int] = {"temperature": temperature}
+        if num_predict is not None:
+            options["num_predict"] = num_predict
+        return {
             "model": model,
-            "stream": False,
+            "stream": stream,
             "messages": [
                 {"role": "system", "content": system},
                 {"role": "user", "content": user},
             ],
-            "options": {"temperature": temperature},
+            "options": options,
         }
-        resp = requests.post(f"{self.base_url}/api/chat", json=payload, timeout=timeout)
+
+    def chat(
+        self,
+        model: str,
+        system: str,
+        user: str,
+        temperature: float = 0.0,
+        timeout: int = 1800,
+        num_predict: int | None = None,
+    ) -> str:
+        payload = self._chat_payload(model, system, user, temperature, stream=False, num_predict=num_predict)
+        resp = self._session.post(f"{self.base_url}/api/chat", json=payload, timeout=timeout)
         resp.raise_for_status()
         data = resp.json()
         return data["message"]["content"]
 
+    def chat_stream(
+        self,
+        model: str,
+        system: str,
+        user: str,
+        temperature: float = 0.0,
+        timeout: int = 1800,
+        num_predict: int | None = None,
+    ) -> Iterator[str]:
+        """Yield message content deltas as Ollama generates them (``stream: true``)."""
+        payload = self._chat_payload(model, system, user, temperature, stream=True, num_predict=num_predict)
+        with self._session.post(f"{self.base_url}/api/chat", json=payload, timeout=timeout, stream=True) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                if data.get("error"):
+                    raise RuntimeError(f"Ollama stream error: {data['error']}")
+                chunk = data.get("message", {}).get("content", "")
+                if chunk:
+                    yield chunk
+                if data.get("done"):
+                    break
+
     def embeddings(self, model: str, text: str) -> list[float]:
         payload = {"model": model, "prompt": text}
-        resp = requests.post(f"{self.base_url}/api/embeddings", json=payload, timeout=120)
+        resp = self._session.post(f"{self.base_url}/api/embeddings", json=payload, timeout=120)
         resp.raise_for_status()
         data = resp.json()
         emb = data.get("embedding")
@@ -40,7 +111,7 @@ class OllamaClient:
         return emb
 
     def list_models(self) -> list[str]:
-        resp = requests.get(f"{self.base_url}/api/tags", timeout=20)
+        resp = self._session.get(f"{self.base_url}/api/tags", timeout=20)
         resp.raise_for_status()
         data = resp.json()
         models = data.get("models", [])
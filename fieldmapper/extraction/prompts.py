@@ -194,9 +194,27 @@ SECTION_SYNTHESIS_SYSTEM_PROMPT = (
 )
 
 SECTION_SYNTHESIS_USER_TEMPLATE = """
+Corpus-wide evidence shared by every section (JSON):
+{shared_evidence_json}
+
+General writing requirements:
+- Write in English.
+- Avoid bullet lists unless strictly necessary for parallel structure.
+- Cite with (Author, Year) style only. Never wrap citations in backticks.
+- Temporal direction is strict: newer work may refine or challenge older work, never the reverse.
+- Do NOT expose internal IDs such as paper_XXX.
+- Do NOT repeat content from the previously written sections listed below.
+- Include at least 3 explicit cause-effect statements.
+- Short, vague, or generic answers are unacceptable.
+
+--- SECTION ---
 Target section: {section_name}
 Target key: {section_key}
 
+Section-specific requirements:
+{section_instructions}
+Target word count: {word_target}
+
 Previously written sections — DO NOT repeat the same claims, examples, or theory descriptions:
 {context_so_far}
 
@@ -206,24 +224,45 @@ Theory units identified in this corpus:
 Theory genealogy data:
 {genealogy_excerpt}
 
-Evidence bundle (JSON):
+Section evidence bundle (JSON):
 {evidence_json}
 
-Section-specific requirements:
-{section_instructions}
+Return ONLY plain text for this section body (no markdown heading, no JSON wrapper).
+""".strip()
 
-General writing requirements:
+BATCHED_SYNTHESIS_USER_TEMPLATE = """
+Corpus-wide evidence shared by every section (JSON):
+{shared_evidence_json}
+
+General writing requirements (apply to every section):
 - Write in English.
 - Avoid bullet lists unless strictly necessary for parallel structure.
 - Cite with (Author, Year) style only. Never wrap citations in backticks.
 - Temporal direction is strict: newer work may refine or challenge older work, never the reverse.
 - Do NOT expose internal IDs such as paper_XXX.
-- Do NOT repeat content from the previously written sections shown above.
-- Include at least 3 explicit cause-effect statements.
+- Do NOT repeat the same claims, examples, or theory descriptions across sections.
+- Include at least 3 explicit cause-effect statements per section.
 - Short, vague, or generic answers are unacceptable.
-- Target word count: {word_target}
 
-Return ONLY plain text for this section body (no markdown heading, no JSON wrapper).
+Theory units identified in this corpus:
+{theory_units_json}
+
+Theory genealogy data:
+{genealogy_excerpt}
+
+Evidence bundle (JSON):
+{evidence_json}
+
+Write ALL of the following sections, in this order:
+{section_specs}
+
+Output format:
+- Wrap each section body in its markers on their own lines, e.g.
+[SECTION:field_landscape]
+...section body...
+[/SECTION:field_landscape]
+- Use exactly the keys listed above. Plain text only inside the markers (no markdown headings, no JSON).
+- Output nothing outside the markers.
 """.strip()
 
 # ---------------------------------------------------------------------------
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +13,30 @@ def write_json(path: Path, payload: Any) -> None:
     path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
+def write_text_atomic(path: Path, text: str) -> None:
+    """Write ``text`` so readers see either the old file or the complete new one, never a partial write."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def list_head(value: Any, limit: int) -> list:
+    """First ``limit`` items of an LLM-derived list field.
+
+    Follows the paper extractor's normalisation: a non-blank string counts as one
+    item and any other non-list value as none, so malformed fields can't raise.
+    """
+    if isinstance(value, str):
+        return [value] if value.strip() else []
+    if not isinstance(value, (list, tuple)):
+        return []
+    return list(islice(value, limit))
+
+
 def read_json(path: Path) -> Any:
     return json.loads(path.read_text(encoding="utf-8"))
 
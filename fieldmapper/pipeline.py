@@ -18,7 +18,7 @@ from fieldmapper.reporting.knowledge_base import build_concept_method_knowledge_
 from fieldmapper.reporting.openalex import enrich_report_with_openalex
 from fieldmapper.reporting.report_generator import generate_report_markdown, write_report
 from fieldmapper.reporting.review_writer import generate_review_report_markdown
-from fieldmapper.synthesis.field_synthesizer import synthesize_field_report
+from fieldmapper.synthesis.field_synthesizer import synthesize_field_report, synthesize_field_report_batched
 from fieldmapper.synthesis.theory_extractor import build_theory_genealogy, extract_theory_units
 from fieldmapper.visualization.concept_map import render_concept_map, render_concept_map_html
 
@@ -66,8 +66,12 @@ def _write_report_variants(
 
 
 def run_pipeline(config: PipelineConfig) -> dict[str, Path]:
+    with OllamaClient(base_url=config.ollama_url) as client:
+        return _run_pipeline(config, client)
+
+
+def _run_pipeline(config: PipelineConfig, client: OllamaClient) -> dict[str, Path]:
     out_dir = ensure_dir(config.output_dir)
-    client = OllamaClient(base_url=config.ollama_url)
 
     # ── Stage 1: Ingestion ──────────────────────────────────────────────────
     papers = load_pdf_texts(config.input_dir)
@@ -111,6 +115,8 @@ def run_pipeline(config: PipelineConfig) -> dict[str, Path]:
         concept_method_kb=concept_method_kb,
         client=client,
         llm_model=config.llm_model,
+        speculative_retry=config.theory_speculative_retry,
+        cache_dir=config.theory_cache_dir,
     )
     theory_units_path = out_dir / "theory_units.json"
     write_json(theory_units_path, theory_units)
@@ -122,13 +128,16 @@ def run_pipeline(config: PipelineConfig) -> dict[str, Path]:
         papers=structured,
         client=client,
         llm_model=config.llm_model,
+        speculative_retry=config.theory_speculative_retry,
+        cache_dir=config.theory_cache_dir,
     )
     theory_genealogy_path = out_dir / "theory_genealogy.json"
     write_json(theory_genealogy_path, theory_genealogy)
 
     # ── Stage C: Field-Level Synthesis (sequential, cross-aware) ───────────
     print("Synthesizing field report sections...")
-    synthesis = synthesize_field_report(
+    synthesize = synthesize_field_report_batched if config.synthesis_batched else synthesize_field_report
+    synthesis = synthesize(
         papers=structured,
         clusters=clusters,
         llm_model=config.llm_model,
@@ -136,6 +145,11 @@ def run_pipeline(config: PipelineConfig) -> dict[str, Path]:
         concept_method_kb=concept_method_kb,
         theory_units=theory_units,
         theory_genealogy=theory_genealogy,
+        max_parallel_requests=config.synthesis_parallel_requests,
+        cross_revise=config.synthesis_cross_revise,
+        overlap_sections=config.synthesis_overlap_sections,
+        cache_dir=config.section_cache_dir,
+        on_section=lambda key, _text: print(f"  - {key} done"),
     )
     synthesis_path = out_dir / "field_report_sections.json"
     write_json(synthesis_path, synthesis)
@@ -275,17 +289,17 @@ def regenerate_report_from_output(
             citation_registry = build_citation_registry(structured)
             write_json(citation_registry_path, citation_registry)
 
-    client = OllamaClient(base_url=ollama_url)
-    review_report = generate_review_report_markdown(
-        synthesis=synthesis,
-        clusters=clusters,
-        raw_report=raw_report,
-        concept_method_kb=concept_method_kb,
-        citation_registry_map=citation_registry,
-        report_language=report_language,
-        llm_model=llm_model,
-        client=client,
-    )
+    with OllamaClient(base_url=ollama_url) as client:
+        review_report = generate_review_report_markdown(
+            synthesis=synthesis,
+            clusters=clusters,
+            raw_report=raw_report,
+            concept_method_kb=concept_method_kb,
+            citation_registry_map=citation_registry,
+            report_language=report_language,
+            llm_model=llm_model,
+            client=client,
+        )
     enriched = enrich_report_with_openalex(review_report, citation_registry)
     final_report = enriched["report_text"]
     openalex_matches_path = out_dir / "openalex_citation_matches.json"
@@ -43,38 +43,37 @@ def _format_scalar(value: Any) -> str:
     return str(value).strip()
 
 
-def _render_markdown(value: Any, indent: int = 0) -> str:
+def _render_into(value: Any, indent: int, out: list[str]) -> None:
+    """Append rendered markdown lines for *value* to *out* (shared across recursion)."""
     pad = "  " * indent
 
     if isinstance(value, str):
         stripped = value.strip()
         if not stripped:
-            return ""
+            return
         if stripped[0] in "[{":
             try:
                 parsed = json.loads(stripped)
-                return _render_markdown(parsed, indent=indent)
             except Exception:
-                return stripped
-        return stripped
+                out.append(stripped)
+                return
+            _render_into(parsed, indent, out)
+            return
+        out.append(stripped)
+        return
 
     if isinstance(value, dict):
-        lines: list[str] = []
         for key, item in value.items():
             title = _to_title(str(key))
             if isinstance(item, (dict, list)):
-                nested = _render_markdown(item, indent=indent + 1)
-                if nested:
-                    lines.append(f"{pad}- **{title}**")
-                    lines.append(nested)
+                _render_nested(f"{pad}- **{title}**", item, indent + 1, out)
             else:
                 scalar = _format_scalar(item)
                 if scalar:
-                    lines.append(f"{pad}- **{title}**: {scalar}")
-        return "\n".join(lines)
+                    out.append(f"{pad}- **{title}**: {scalar}")
+        return
 
     if isinstance(value, list):
-        lines: list[str] = []
         for item in value:
             if isinstance(item, dict):
                 lead = ""
@@ -84,32 +83,40 @@ def _render_markdown(value: Any, indent: int = 0) -> str:
                         lead = candidate
                         break
 
-                remaining = dict(item)
-                for key in ("model_name", "title", "name", "label", "cluster"):
-                    remaining.pop(key, None)
-
                 if lead:
-                    lines.append(f"{pad}- **{lead}**")
-                    nested = _render_markdown(remaining, indent=indent + 1)
-                    if nested:
-                        lines.append(nested)
+                    remaining = dict(item)
+                    for key in ("model_name", "title", "name", "label", "cluster"):
+                        remaining.pop(key, None)
+                    out.append(f"{pad}- **{lead}**")
+                    _render_into(remaining, indent + 1, out)
                 else:
-                    nested = _render_markdown(item, indent=indent + 1)
-                    if nested:
-                        lines.append(f"{pad}-")
-                        lines.append(nested)
+                    _render_nested(f"{pad}-", item, indent + 1, out)
             elif isinstance(item, list):
-                nested = _render_markdown(item, indent=indent + 1)
-                if nested:
-                    lines.append(f"{pad}-")
-                    lines.append(nested)
+                _render_nested(f"{pad}-", item, indent + 1, out)
             else:
                 scalar = _format_scalar(item)
                 if scalar:
-                    lines.append(f"{pad}- {scalar}")
-        return "\n".join(lines)
+                    out.append(f"{pad}- {scalar}")
+        return
+
+    scalar = _format_scalar(value)
+    if scalar:
+        out.append(scalar)
 
-    return _format_scalar(value)
+
+def _render_nested(header: str, item: Any, indent: int, out: list[str]) -> None:
+    """Render *item* under *header*, dropping the header again if nothing was emitted."""
+    mark = len(out)
+    out.append(header)
+    _render_into(item, indent, out)
+    if len(out) == mark + 1:
+        out.pop()
+
+
+def _render_markdown(value: Any, indent: int = 0) -> str:
+    out: list[str] = []
+    _render_into(value, indent, out)
+    return "\n".join(out)
 
 
 def _section_text(value: Any) -> str:
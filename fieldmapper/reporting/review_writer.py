@@ -10,6 +10,7 @@ from fieldmapper.reporting.knowledge_base import render_method_dossiers_markdown
 from fieldmapper.reporting.report_generator import REPORT_HEADINGS
 
 SECTION_PATTERN = re.compile(r"(^# .+?$)(.*?)(?=^# |\Z)", re.MULTILINE | re.DOTALL)
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?])\s+")
 EXPECTED_HEADINGS = REPORT_HEADINGS
 
 # Headings that get theory dossiers as supplemental context
@@ -36,6 +37,10 @@ def _looks_like_json_dump(text: str) -> bool:
 
 
 def _split_sections(markdown: str) -> list[tuple[str, str]]:
+    # Cheap substring probe so heading-less input skips the full-buffer regex walk
+    if not markdown.startswith("# ") and "\n# " not in markdown:
+        return []
+
     sections: list[tuple[str, str]] = []
     for match in SECTION_PATTERN.finditer(markdown):
         heading = match.group(1).strip()
@@ -60,7 +65,7 @@ def _repair_markdown_structure(markdown: str) -> str:
         repaired_sections: list[str] = []
         parts = _split_sections(text)
         for heading, body in parts:
-            sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+", body.strip()) if s.strip()]
+            sentences = [s for s in (part.strip() for part in SENTENCE_BOUNDARY_PATTERN.split(body.strip())) if s]
             if not sentences:
                 repaired_sections.append(f"{heading}\n")
                 continue
@@ -74,6 +79,14 @@ def _repair_markdown_structure(markdown: str) -> str:
     return text + "\n"
 
 
+def _prebind_template(template: str, **fields: str) -> str:
+    """Substitute report-invariant fields once, leaving the per-section placeholders for ``str.format``."""
+    for name, value in fields.items():
+        escaped = value.replace("{", "{{").replace("}", "}}")
+        template = template.replace("{" + name + "}", escaped)
+    return template
+
+
 def _build_supplemental(
     heading: str,
     theory_context: str,
@@ -100,17 +113,14 @@ def _rewrite_one_section(
     body: str,
     supplemental_context: str,
     accumulated_context: str,
-    citation_registry: str,
-    report_language: str,
+    prompt_template: str,
     llm_model: str,
     client: OllamaClient,
 ) -> str:
     source_section = f"{heading}\n{body}".strip()
-    prompt = REVIEW_SECTION_REWRITE_USER_TEMPLATE.format(
-        language=report_language,
+    prompt = prompt_template.format(
         accumulated_context=accumulated_context or "None yet — this is the first section being rewritten.",
         supplemental_context=supplemental_context,
-        citation_registry=citation_registry,
         section_markdown=source_section,
     )
 
@@ -134,7 +144,8 @@ def _rewrite_one_section(
     if _normalize(text) == _normalize(source_section):
         return source_section
 
-    if heading not in text:
+    # Models almost always lead with the heading; only scan the body when they don't
+    if not text.startswith(heading) and heading not in text:
         text = f"{heading}\n\n{text}"
 
     return text.strip()
@@ -150,11 +161,21 @@ def generate_review_report_markdown(
     llm_model: str,
     client: OllamaClient,
 ) -> str:
+    """Rewrite every raw report section in order with one shared ``client``.
+
+    All section calls go through the same ``OllamaClient`` instance so they reuse
+    its pooled keep-alive connection; the caller owns the client's lifetime.
+    """
     del synthesis, clusters  # Section rewrite uses raw report plus compact supplemental context.
 
     theory_context = render_theory_dossiers_markdown(concept_method_kb, limit=24)
     method_context = render_method_dossiers_markdown(concept_method_kb, limit=24)
     citation_registry = render_citation_registry_markdown(citation_registry_map)
+    prompt_template = _prebind_template(
+        REVIEW_SECTION_REWRITE_USER_TEMPLATE,
+        language=report_language,
+        citation_registry=citation_registry,
+    )
 
     sections = _split_sections(raw_report)
     if not sections:
@@ -177,8 +198,7 @@ def generate_review_report_markdown(
             body=body,
             supplemental_context=supplemental_context,
             accumulated_context=accumulated_context,
-            citation_registry=citation_registry,
-            report_language=report_language,
+            prompt_template=prompt_template,
             llm_model=llm_model,
             client=client,
         )
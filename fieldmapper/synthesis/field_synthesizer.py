@@ -2,17 +2,40 @@ from __future__ import annotations
 
 import json
 import logging
-from collections import Counter, defaultdict
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import Any
 
+import requests
+
+from fieldmapper.extraction.llm_cache import llm_cache_path
 from fieldmapper.extraction.ollama_client import OllamaClient
 from fieldmapper.extraction.prompts import (
+    BATCHED_SYNTHESIS_USER_TEMPLATE,
     SECTION_SYNTHESIS_SYSTEM_PROMPT,
     SECTION_SYNTHESIS_USER_TEMPLATE,
 )
+from fieldmapper.io_utils import list_head, write_text_atomic
 
 LOGGER = logging.getLogger(__name__)
 
+# Per-section LLM attempts on transient errors before falling back to the templated summary
+SECTION_MAX_ATTEMPTS = 4
+SECTION_RETRY_BASE_DELAY = 2.0
+SECTION_RETRY_MAX_DELAY = 30.0
+# Sections that exhaust their retries in a row before the rest skip the LLM entirely
+SECTION_CIRCUIT_BREAKER_THRESHOLD = 2
+# Length of the per-section summary later sections receive as context
+SECTION_SUMMARY_CHARS = 250
+# Batched synthesis: no generation cap, the single response carries every section
+BATCHED_SYNTHESIS_NUM_PREDICT = -1
+BATCHED_SECTION_PATTERN = re.compile(r"\[SECTION:(\w+)\]\s*(.*?)\s*\[/SECTION:\1\]", re.DOTALL)
+
 SECTION_SPECS: list[tuple[str, str]] = [
     ("field_landscape", "Field Landscape"),
     ("conceptual_architecture", "Conceptual Architecture"),
@@ -137,6 +160,20 @@ SECTION_WORD_TARGETS: dict[str, str] = {
     "open_problems": "1500-2500 words",
 }
 
+DEFAULT_SECTION_WORD_TARGET = "1000-1500 words"
+
+# key -> (name, instructions, word target), resolved once at import; edit the tables above
+SECTION_SPEC_TABLE: dict[str, tuple[str, str, str]] = {
+    key: (name, SECTION_INSTRUCTIONS[key], SECTION_WORD_TARGETS[key]) for key, name in SECTION_SPECS
+}
+
+
+def _section_spec(section_key: str, section_name: str) -> tuple[str, str, str]:
+    return SECTION_SPEC_TABLE.get(
+        section_key,
+        (section_name, f"Write analytically about {section_name}.", DEFAULT_SECTION_WORD_TARGET),
+    )
+
 
 def _compact_papers(papers: list[dict], limit: int = 50) -> list[dict]:
     compact: list[dict] = []
@@ -150,9 +187,9 @@ def _compact_papers(papers: list[dict], limit: int = 50) -> list[dict]:
                 "core_problem": paper.get("core_problem", ""),
                 "main_claim": paper.get("main_claim", ""),
                 "limitations": paper.get("limitations", ""),
-                "key_concepts": list(paper.get("key_concepts", []))[:8],
-                "theoretical_framework": list(paper.get("theoretical_framework", []))[:6],
-                "method_category": list(paper.get("method_category", []))[:6],
+                "key_concepts": list_head(paper.get("key_concepts"), 8),
+                "theoretical_framework": list_head(paper.get("theoretical_framework"), 6),
+                "method_category": list_head(paper.get("method_category"), 6),
             }
         )
     return compact
@@ -166,28 +203,38 @@ def _compact_clusters(clusters: list[dict], limit: int = 40) -> list[dict]:
                 "cluster_id": cluster.get("cluster_id", ""),
                 "representative_label": cluster.get("representative_label", ""),
                 "paper_count": cluster.get("paper_count", 0),
-                "concepts": list(cluster.get("concepts", []))[:10],
-                "paper_ids": list(cluster.get("paper_ids", []))[:12],
+                "concepts": list_head(cluster.get("concepts"), 10),
+                "paper_ids": list_head(cluster.get("paper_ids"), 12),
             }
         )
     return compact
 
 
-def _top_counts(items: list[str], top_n: int) -> list[dict[str, Any]]:
-    counter = Counter(x for x in items if x)
+def _top_counts(counter: Counter[str], top_n: int) -> list[dict[str, Any]]:
     return [{"name": name, "count": count} for name, count in counter.most_common(top_n)]
 
 
-def _compact_theory_units_for_section(theory_units: list[dict], section_key: str) -> list[dict]:
-    """Return a section-appropriate subset of theory unit fields to avoid token bloat."""
+# Which theory-unit projection each section receives; sections sharing one share its encoding
+THEORY_UNIT_PROJECTIONS: dict[str, str] = {
+    "major_theoretical_models": "full",
+    "theory_genealogy_section": "genealogy",
+    "research_trajectory": "genealogy",
+    "theoretical_fault_lines": "fault",
+    "open_problems": "open",
+    "conceptual_architecture": "arch",
+}
+
+
+def _project_theory_units(theory_units: list[dict], projection: str) -> list[dict]:
+    """Return one projection (see THEORY_UNIT_PROJECTIONS) of the theory unit fields to avoid token bloat."""
     if not theory_units:
         return []
 
-    if section_key == "major_theoretical_models":
+    if projection == "full":
         # Full detail
         return theory_units
 
-    if section_key in ("theory_genealogy_section", "research_trajectory"):
+    if projection == "genealogy":
         return [
             {
                 "theory_id": u.get("theory_id", ""),
@@ -202,7 +249,7 @@ def _compact_theory_units_for_section(theory_units: list[dict], section_key: str
             for u in theory_units
         ]
 
-    if section_key == "theoretical_fault_lines":
+    if projection == "fault":
         return [
             {
                 "theory_id": u.get("theory_id", ""),
@@ -214,7 +261,7 @@ def _compact_theory_units_for_section(theory_units: list[dict], section_key: str
             for u in theory_units
         ]
 
-    if section_key == "open_problems":
+    if projection == "open":
         return [
             {
                 "theory_id": u.get("theory_id", ""),
@@ -226,7 +273,7 @@ def _compact_theory_units_for_section(theory_units: list[dict], section_key: str
             for u in theory_units
         ]
 
-    if section_key == "conceptual_architecture":
+    if projection == "arch":
         return [
             {
                 "theory_id": u.get("theory_id", ""),
@@ -237,7 +284,7 @@ def _compact_theory_units_for_section(theory_units: list[dict], section_key: str
             for u in theory_units
         ]
 
-    # field_landscape and methodological_landscape: brief overview
+    # "brief" (field_landscape and methodological_landscape): overview only
     return [
         {
             "theory_id": u.get("theory_id", ""),
@@ -248,12 +295,35 @@ def _compact_theory_units_for_section(theory_units: list[dict], section_key: str
     ]
 
 
-def _genealogy_excerpt_for_section(theory_genealogy: dict, section_key: str) -> str:
-    """Return a section-appropriate excerpt of the genealogy data."""
+def _theory_units_json(theory_units: list[dict]) -> dict[str, str]:
+    """Theory-unit JSON per section, projecting and encoding each distinct projection only once."""
+    by_projection: dict[str, str] = {}
+    encoded: dict[str, str] = {}
+    for key, _ in SECTION_SPECS:
+        projection = THEORY_UNIT_PROJECTIONS.get(key, "brief")
+        if projection not in by_projection:
+            by_projection[projection] = json.dumps(
+                _project_theory_units(theory_units, projection), ensure_ascii=False
+            )
+        encoded[key] = by_projection[projection]
+    return encoded
+
+
+# Which genealogy excerpt each section receives; sections sharing a shape share one encoding
+GENEALOGY_EXCERPT_SHAPES: dict[str, str] = {
+    "theory_genealogy_section": "full",
+    "research_trajectory": "chains",
+    "theoretical_fault_lines": "chains",
+    "field_landscape": "intro",
+}
+
+
+def _genealogy_excerpt(theory_genealogy: dict, shape: str) -> str:
+    """Encode one genealogy excerpt shape (see GENEALOGY_EXCERPT_SHAPES)."""
     if not theory_genealogy:
         return "No genealogy data available."
 
-    if section_key == "theory_genealogy_section":
+    if shape == "full":
         narrative = theory_genealogy.get("narrative", "")
         chains = theory_genealogy.get("causal_chains", [])
         shifts = theory_genealogy.get("dominant_paradigm_shifts", [])
@@ -262,12 +332,12 @@ def _genealogy_excerpt_for_section(theory_genealogy: dict, section_key: str) ->
             ensure_ascii=False,
         )
 
-    if section_key in ("research_trajectory", "theoretical_fault_lines"):
+    if shape == "chains":
         chains = theory_genealogy.get("causal_chains", [])
         shifts = theory_genealogy.get("dominant_paradigm_shifts", [])
         return json.dumps({"causal_chains": chains, "dominant_paradigm_shifts": shifts}, ensure_ascii=False)
 
-    if section_key == "field_landscape":
+    if shape == "intro":
         shifts = theory_genealogy.get("dominant_paradigm_shifts", [])
         narrative_head = theory_genealogy.get("narrative", "")[:800]
         return json.dumps({"dominant_paradigm_shifts": shifts, "narrative_intro": narrative_head}, ensure_ascii=False)
@@ -278,6 +348,18 @@ def _genealogy_excerpt_for_section(theory_genealogy: dict, section_key: str) ->
     )
 
 
+def _genealogy_excerpts(theory_genealogy: dict) -> dict[str, str]:
+    """Genealogy excerpt per section, encoding each distinct shape only once."""
+    by_shape: dict[str, str] = {}
+    excerpts: dict[str, str] = {}
+    for key, _ in SECTION_SPECS:
+        shape = GENEALOGY_EXCERPT_SHAPES.get(key, "shifts")
+        if shape not in by_shape:
+            by_shape[shape] = _genealogy_excerpt(theory_genealogy, shape)
+        excerpts[key] = by_shape[shape]
+    return excerpts
+
+
 def _build_evidence_index(
     papers: list[dict],
     clusters: list[dict],
@@ -289,22 +371,24 @@ def _build_evidence_index(
     clusters_compact = _compact_clusters(clusters)
     kb = concept_method_kb or {}
 
-    theories: list[str] = []
-    methods: list[str] = []
+    # Aggregates run over the compacted papers (capped by _compact_papers' limit),
+    # so these scans stay small no matter how large the corpus is. Each label is
+    # coerced and stripped exactly once and counted straight into its Counter.
+    theories = Counter(
+        label for paper in papers_compact for x in paper["theoretical_framework"] if (label := str(x).strip())
+    )
+    methods = Counter(
+        label for paper in papers_compact for x in paper["method_category"] if (label := str(x).strip())
+    )
     limitations: list[str] = []
-    yearly: dict[str, int] = defaultdict(int)
-
+    yearly: Counter[str] = Counter()
     for paper in papers_compact:
-        theories.extend(str(x).strip() for x in paper.get("theoretical_framework", []) if str(x).strip())
-        methods.extend(str(x).strip() for x in paper.get("method_category", []) if str(x).strip())
-        limitation = str(paper.get("limitations", "")).strip()
-        if limitation:
+        if limitation := str(paper["limitations"]).strip():
             limitations.append(limitation)
-        year = str(paper.get("year", "")).strip()
-        if year:
+        if year := str(paper["year"]).strip():
             yearly[year] += 1
 
-    timeline = [{"year": y, "paper_count": c} for y, c in sorted(yearly.items())]
+    timeline = [{"year": year, "paper_count": yearly[year]} for year in sorted(yearly)]
 
     return {
         "meta": {
@@ -324,59 +408,79 @@ def _build_evidence_index(
     }
 
 
-def _section_evidence(section_key: str, evidence: dict[str, Any]) -> dict[str, Any]:
-    base: dict[str, Any] = {
+def _shared_evidence_json(evidence: dict[str, Any]) -> str:
+    """Serialize the corpus-wide evidence every section sees, once and in a stable byte layout.
+
+    This block leads every section prompt so the Ollama server can reuse the KV
+    cache of the identical prefix across the section calls.
+    """
+    shared = {
         "meta": evidence.get("meta", {}),
         "top_theories": evidence.get("top_theories", []),
         "top_methods": evidence.get("top_methods", []),
         "timeline": evidence.get("timeline", []),
     }
+    return json.dumps(shared, ensure_ascii=False, sort_keys=True)
+
+
+# Evidence fields (with optional slice limit) each section bundle receives, in prompt order
+SECTION_EVIDENCE_FIELDS: dict[str, tuple[tuple[str, int | None], ...]] = {
+    "field_landscape": (("papers", 20), ("clusters", 15)),
+    "conceptual_architecture": (("clusters", None), ("papers", 20), ("kb_theories", 10)),
+    # Genealogy content is passed separately via genealogy_excerpt
+    "theory_genealogy_section": (("papers", None),),
+    "major_theoretical_models": (("papers", None), ("kb_theories", None), ("common_limitations", None)),
+    "methodological_landscape": (("papers", 28), ("kb_methods", None), ("common_limitations", None)),
+    "theoretical_fault_lines": (("papers", None), ("common_limitations", None), ("kb_theories", 10)),
+    "research_trajectory": (("papers", 25), ("clusters", 20)),
+    "open_problems": (("papers", 28), ("common_limitations", None), ("kb_theories", 10)),
+}
+DEFAULT_SECTION_EVIDENCE_FIELDS: tuple[tuple[str, int | None], ...] = (("papers", 28), ("clusters", 20))
+# Union of the section bundles, for the single-call batched synthesis
+BATCHED_EVIDENCE_FIELDS: tuple[tuple[str, int | None], ...] = (
+    ("papers", None),
+    ("clusters", None),
+    ("kb_theories", None),
+    ("kb_methods", None),
+    ("common_limitations", None),
+)
 
-    if section_key == "field_landscape":
-        base["papers"] = evidence.get("papers", [])[:20]
-        base["clusters"] = evidence.get("clusters", [])[:15]
-
-    elif section_key == "conceptual_architecture":
-        base["clusters"] = evidence.get("clusters", [])
-        base["papers"] = evidence.get("papers", [])[:20]
-        base["kb_theories"] = evidence.get("kb_theories", [])[:10]
-
-    elif section_key == "theory_genealogy_section":
-        base["papers"] = evidence.get("papers", [])
-        # Genealogy content is passed separately via genealogy_excerpt
-
-    elif section_key == "major_theoretical_models":
-        base["papers"] = evidence.get("papers", [])
-        base["kb_theories"] = evidence.get("kb_theories", [])
-        base["common_limitations"] = evidence.get("common_limitations", [])
 
-    elif section_key == "methodological_landscape":
-        base["papers"] = evidence.get("papers", [])[:28]
-        base["kb_methods"] = evidence.get("kb_methods", [])
-        base["common_limitations"] = evidence.get("common_limitations", [])
+def _encode_evidence_fragments(evidence: dict[str, Any]) -> dict[tuple[str, int | None], str]:
+    """JSON-encode every evidence slice any section needs, once per report.
 
-    elif section_key == "theoretical_fault_lines":
-        base["papers"] = evidence.get("papers", [])
-        base["common_limitations"] = evidence.get("common_limitations", [])
-        base["kb_theories"] = evidence.get("kb_theories", [])[:10]
+    A limit at or above the list length selects the whole list, so it shares the
+    unsliced encoding instead of copying the list and encoding it again.
+    """
+    fragments: dict[tuple[str, int | None], str] = {}
+    for fields in (*SECTION_EVIDENCE_FIELDS.values(), DEFAULT_SECTION_EVIDENCE_FIELDS, BATCHED_EVIDENCE_FIELDS):
+        for name, limit in fields:
+            if (name, limit) in fragments:
+                continue
+            value = evidence.get(name, [])
+            if limit is not None and limit < len(value):
+                fragments[(name, limit)] = json.dumps(value[:limit], ensure_ascii=False)
+                continue
+            if (name, None) not in fragments:
+                fragments[(name, None)] = json.dumps(value, ensure_ascii=False)
+            fragments[(name, limit)] = fragments[(name, None)]
+    return fragments
 
-    elif section_key == "research_trajectory":
-        base["papers"] = evidence.get("papers", [])[:25]
-        base["clusters"] = evidence.get("clusters", [])[:20]
 
-    elif section_key == "open_problems":
-        base["papers"] = evidence.get("papers", [])[:28]
-        base["common_limitations"] = evidence.get("common_limitations", [])
-        base["kb_theories"] = evidence.get("kb_theories", [])[:10]
+def _section_evidence_json(section_key: str, fragments: dict[tuple[str, int | None], str]) -> str:
+    """Splice pre-encoded fragments into the section's evidence bundle (a JSON object literal)."""
+    return _evidence_bundle_json(SECTION_EVIDENCE_FIELDS.get(section_key, DEFAULT_SECTION_EVIDENCE_FIELDS), fragments)
 
-    else:
-        base["papers"] = evidence.get("papers", [])[:28]
-        base["clusters"] = evidence.get("clusters", [])[:20]
 
-    return base
+def _evidence_bundle_json(
+    fields: tuple[tuple[str, int | None], ...], fragments: dict[tuple[str, int | None], str]
+) -> str:
+    members = ", ".join(f"{json.dumps(name)}: {fragments[(name, limit)]}" for name, limit in fields)
+    return "{" + members + "}"
 
 
-def _fallback_section(section_key: str, evidence: dict[str, Any]) -> str:
+def _fallback_text(evidence: dict[str, Any]) -> str:
+    """Evidence-only stand-in for a section body; built once per report and shared by every section."""
     meta = evidence.get("meta", {})
     top_theories = evidence.get("top_theories", [])
     top_methods = evidence.get("top_methods", [])
@@ -384,13 +488,11 @@ def _fallback_section(section_key: str, evidence: dict[str, Any]) -> str:
     timeline = evidence.get("timeline", [])
     papers = evidence.get("papers", [])
 
-    theory_text = ", ".join(t["name"] for t in top_theories[:8]) or "No dominant theory labels extracted"
-    method_text = ", ".join(m["name"] for m in top_methods[:8]) or "No dominant method labels extracted"
-    years = ", ".join(f"{x['year']}({x['paper_count']})" for x in timeline[:10]) or "No year metadata"
+    theory_text = ", ".join([t["name"] for t in top_theories[:8]]) or "No dominant theory labels extracted"
+    method_text = ", ".join([m["name"] for m in top_methods[:8]]) or "No dominant method labels extracted"
+    years = ", ".join([f"{x['year']}({x['paper_count']})" for x in timeline[:10]]) or "No year metadata"
     sample_limitations = " | ".join(common_limitations[:3]) or "No explicit limitations extracted"
-    sample_claims = " | ".join(
-        str(p.get("main_claim", "")).strip() for p in papers[:3] if str(p.get("main_claim", "")).strip()
-    )
+    sample_claims = " | ".join([claim for p in papers[:3] if (claim := str(p["main_claim"]).strip())])
     sample_claims = sample_claims or "No strong main-claim snippets extracted"
 
     return (
@@ -403,45 +505,260 @@ def _fallback_section(section_key: str, evidence: dict[str, Any]) -> str:
     )
 
 
+def _is_trivial_corpus(papers: list[dict], clusters: list[dict], theory_units: list[dict] | None) -> bool:
+    return not papers and not clusters and not theory_units
+
+
+def _fallback_report(
+    evidence: dict[str, Any], on_section: Callable[[str, str], None] | None
+) -> dict[str, str]:
+    """Every section as the evidence fallback, for inputs too thin to be worth an LLM call."""
+    LOGGER.warning("No papers, clusters or theory units to synthesize; using evidence fallback for all sections")
+    fallback_text = _fallback_text(evidence)
+    payload = {key: fallback_text for key, _ in SECTION_SPECS}
+    if on_section is not None:
+        for key, text in payload.items():
+            on_section(key, text)
+    return payload
+
+
+def _expected_section_cost(section_key: str, section_evidence_json: str) -> tuple[int, int]:
+    """Rough relative cost of a section call: upper word target (decode) then evidence size (prefill)."""
+    _, _, word_target = _section_spec(section_key, section_key)
+    upper = word_target.split()[0].rpartition("-")[2]
+    return (int(upper) if upper.isdigit() else 0, len(section_evidence_json))
+
+
+def _is_transient_error(exc: Exception) -> bool:
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return False
+
+
+def _is_overload_error(exc: Exception) -> bool:
+    return (
+        isinstance(exc, requests.HTTPError)
+        and exc.response is not None
+        and exc.response.status_code in (429, 503)
+    )
+
+
+class _AdaptiveLimiter:
+    """AIMD gate on in-flight section calls, plus a circuit breaker.
+
+    The allowed concurrency is halved when Ollama signals overload (429/503) and
+    grows back by one slot per successful call, up to ``maximum``. Once
+    ``SECTION_CIRCUIT_BREAKER_THRESHOLD`` sections in a row have exhausted their
+    retries, the circuit opens and remaining sections go straight to the fallback.
+    """
+
+    def __init__(self, maximum: int) -> None:
+        self.maximum = max(1, maximum)
+        self.limit = self.maximum
+        self._active = 0
+        self._failed_sections = 0
+        self._cond = threading.Condition()
+
+    def __enter__(self) -> _AdaptiveLimiter:
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    @property
+    def circuit_open(self) -> bool:
+        return self._failed_sections >= SECTION_CIRCUIT_BREAKER_THRESHOLD
+
+    def record_success(self) -> None:
+        with self._cond:
+            self.limit = min(self.maximum, self.limit + 1)
+            self._failed_sections = 0
+            self._cond.notify_all()
+
+    def record_overload(self) -> None:
+        with self._cond:
+            self.limit = max(1, self.limit // 2)
+
+    def record_section_failure(self) -> None:
+        with self._cond:
+            self._failed_sections += 1
+
+
+def _section_cache_path(cache_dir: Path, llm_model: str, prompt: str) -> Path:
+    """Content-addressed cache file for one section: same model + same prompt -> same file."""
+    return llm_cache_path(cache_dir, llm_model, SECTION_SYNTHESIS_SYSTEM_PROMPT, prompt)
+
+
+def _section_summary(section_text: str) -> str:
+    """First characters of a section, used as its context tag for other sections."""
+    summary = section_text.replace("\n", " ").strip()[:SECTION_SUMMARY_CHARS]
+    return summary + ("..." if len(section_text) > SECTION_SUMMARY_CHARS else "")
+
+
+def _read_cache_entry(cache_path: Path, label: str) -> str | None:
+    """Cached text, or None on a miss; unreadable entries are logged and treated as misses."""
+    if not cache_path.exists():
+        return None
+    try:
+        return cache_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as exc:
+        LOGGER.warning("Ignoring unreadable %s cache entry %s: %s", label, cache_path, exc)
+        return None
+
+
+def _write_cache_entry(cache_path: Path, text: str, label: str) -> None:
+    """Best-effort cache write: a failure is logged and never discards the generated text."""
+    try:
+        write_text_atomic(cache_path, text)
+    except OSError as exc:
+        LOGGER.warning("Could not write %s cache entry %s: %s", label, cache_path, exc)
+
+
 def _generate_section(
     section_key: str,
     section_name: str,
-    evidence: dict[str, Any],
+    fallback_text: str,
+    shared_evidence_json: str,
+    section_evidence_json: str,
     context_so_far: str,
-    theory_units_compact: list[dict],
+    theory_units_json: str,
     genealogy_excerpt: str,
     llm_model: str,
     client: OllamaClient,
+    cache_dir: Path | None = None,
+    limiter: _AdaptiveLimiter | None = None,
+    on_summary: Callable[[str], None] | None = None,
 ) -> str:
-    section_evidence = _section_evidence(section_key, evidence)
-    instructions = SECTION_INSTRUCTIONS.get(section_key, f"Write analytically about {section_name}.")
-    word_target = SECTION_WORD_TARGETS.get(section_key, "1000-1500 words")
+    """Write one section body, falling back to ``fallback_text`` when the LLM fails.
+
+    ``on_summary`` receives the section's context summary (see ``_section_summary``)
+    as soon as enough of the response has streamed in to determine it, i.e. long
+    before generation finishes. It fires at most once, and not at all on cache hits,
+    fallbacks, or responses shorter than the summary.
+    """
+    _, instructions, word_target = _section_spec(section_key, section_name)
 
     prompt = SECTION_SYNTHESIS_USER_TEMPLATE.format(
+        shared_evidence_json=shared_evidence_json,
         section_name=section_name,
         section_key=section_key,
         context_so_far=context_so_far or "None yet — this is the first section.",
-        theory_units_json=json.dumps(theory_units_compact, ensure_ascii=False),
+        theory_units_json=theory_units_json,
         genealogy_excerpt=genealogy_excerpt,
-        evidence_json=json.dumps(section_evidence, ensure_ascii=False),
+        evidence_json=section_evidence_json,
         section_instructions=instructions,
         word_target=word_target,
     )
 
-    try:
-        text = client.chat(
-            model=llm_model,
-            system=SECTION_SYNTHESIS_SYSTEM_PROMPT,
-            user=prompt,
-            temperature=0.2,
-            timeout=1800,
-        ).strip()
-        if text:
-            return text
-    except Exception as exc:
-        LOGGER.warning("Section synthesis failed for %s: %s: %s", section_key, type(exc).__name__, exc)
-
-    return _fallback_section(section_key, evidence)
+    cache_path = _section_cache_path(cache_dir, llm_model, prompt) if cache_dir else None
+    cached = _read_cache_entry(cache_path, f"section {section_key}") if cache_path is not None else None
+    if cached:
+        LOGGER.info("Section cache hit for %s: %s", section_key, cache_path.name)
+        return cached
+
+    limiter = limiter or _AdaptiveLimiter(1)
+    if limiter.circuit_open:
+        LOGGER.warning("Skipping LLM for %s: too many consecutive section failures", section_key)
+        return fallback_text
+
+    text = ""
+    for attempt in range(1, SECTION_MAX_ATTEMPTS + 1):
+        try:
+            with limiter:
+                chunks: list[str] = []
+                for chunk in client.chat_stream(
+                    model=llm_model,
+                    system=SECTION_SYNTHESIS_SYSTEM_PROMPT,
+                    user=prompt,
+                    temperature=0.2,
+                    timeout=1800,
+                ):
+                    chunks.append(chunk)
+                    if on_summary is not None:
+                        head = "".join(chunks).strip()
+                        if len(head) > SECTION_SUMMARY_CHARS:
+                            on_summary(_section_summary(head))
+                            on_summary = None
+                text = "".join(chunks).strip()
+            limiter.record_success()
+            break
+        except Exception as exc:
+            LOGGER.warning(
+                "Section synthesis attempt %d/%d failed for %s: %s: %s",
+                attempt,
+                SECTION_MAX_ATTEMPTS,
+                section_key,
+                type(exc).__name__,
+                exc,
+            )
+            if not _is_transient_error(exc):
+                break
+            if _is_overload_error(exc):
+                limiter.record_overload()
+            if attempt == SECTION_MAX_ATTEMPTS:
+                limiter.record_section_failure()
+                break
+            time.sleep(min(SECTION_RETRY_MAX_DELAY, SECTION_RETRY_BASE_DELAY * 2 ** (attempt - 1)))
+
+    if not text:
+        return fallback_text
+    if cache_path is not None:
+        _write_cache_entry(cache_path, text, f"section {section_key}")
+    return text
+
+
+def _gather_sections(
+    pool: ThreadPoolExecutor,
+    schedule: list[tuple[str, str]],
+    run: Callable[[str, str], str],
+    on_section: Callable[[str, str], None] | None,
+) -> dict[str, str]:
+    """Submit ``run(key, name)`` for every section in ``schedule`` order; return results in SECTION_SPECS order."""
+    futures = {key: pool.submit(run, key, name) for key, name in schedule}
+    if on_section is not None:
+        keys_by_future = {future: key for key, future in futures.items()}
+        for future in as_completed(keys_by_future):
+            on_section(keys_by_future[future], future.result())
+    return {key: futures[key].result() for key, _ in SECTION_SPECS}
+
+
+def _generate_sections_overlapped(
+    generate: Callable[[str, str, str, Callable[[str], None]], str],
+    on_section: Callable[[str, str], None] | None,
+) -> dict[str, str]:
+    """Sequential context chain where each section starts once its predecessor's summary is known."""
+
+    def run(key: str, name: str, context_so_far: str, summary: Future[str]) -> str:
+        section_text = ""
+        try:
+            section_text = generate(key, name, context_so_far, summary.set_result)
+            return section_text
+        finally:
+            # Cache hits, fallbacks and short responses never stream a summary
+            if not summary.done():
+                summary.set_result(_section_summary(section_text))
+
+    futures: dict[str, Future[str]] = {}
+    context_so_far = ""
+    with ThreadPoolExecutor(max_workers=len(SECTION_SPECS)) as pool:
+        for key, name in SECTION_SPECS:
+            summary: Future[str] = Future()
+            futures[key] = pool.submit(run, key, name, context_so_far, summary)
+            summary_line = f"- {name}: {summary.result()}"
+            context_so_far = f"{context_so_far}\n{summary_line}" if context_so_far else summary_line
+        if on_section is not None:
+            keys_by_future = {future: key for key, future in futures.items()}
+            for future in as_completed(keys_by_future):
+                on_section(keys_by_future[future], future.result())
+    return {key: futures[key].result() for key, _ in SECTION_SPECS}
 
 
 def synthesize_field_report(
@@ -452,7 +769,37 @@ def synthesize_field_report(
     concept_method_kb: dict[str, Any] | None = None,
     theory_units: list[dict] | None = None,
     theory_genealogy: dict | None = None,
+    max_parallel_requests: int = 1,
+    cache_dir: Path | None = None,
+    on_section: Callable[[str, str], None] | None = None,
+    cross_revise: bool = False,
+    overlap_sections: bool = False,
 ) -> dict[str, Any]:
+    """Generate every report section.
+
+    With ``max_parallel_requests == 1`` sections are written sequentially and each
+    one sees short summaries of the sections before it. Larger values submit the
+    sections concurrently (bounded by the Ollama server's own concurrency) and
+    trade that cross-section context for wall-clock time; ``cross_revise`` then
+    adds a second parallel pass in which every section is regenerated with the
+    first-draft summaries of all other sections as context (a failed revision
+    keeps its draft).
+
+    ``overlap_sections`` keeps the sequential context chain but starts each section
+    as soon as the previous one's summary has streamed in, instead of waiting for
+    its full generation. The LLM calls then overlap, so this only helps with
+    ``max_parallel_requests`` above 1 (which still caps concurrent calls). If an
+    attempt fails after its summary was taken, the next section keeps that summary.
+
+    When ``cache_dir`` is set, generated sections are stored there keyed by a hash
+    of the model and the full prompt, so re-running on unchanged inputs skips the
+    LLM for every section whose prompt is identical.
+
+    ``on_section(section_key, text)`` is called as soon as each section finishes
+    (in completion order when parallel), so callers can start writing output early.
+    With no papers, clusters or theory units there is nothing to synthesize, and every
+    section gets the evidence fallback without an LLM call.
+    """
     evidence = _build_evidence_index(
         papers,
         clusters,
@@ -460,36 +807,193 @@ def synthesize_field_report(
         theory_units=theory_units,
         theory_genealogy=theory_genealogy,
     )
-
-    payload: dict[str, Any] = {}
-    context_summaries: list[tuple[str, str]] = []
-
-    for key, name in SECTION_SPECS:
-        # Build accumulated context from previously written sections (brief summary per section)
-        if context_summaries:
-            context_so_far = "\n".join(
-                f"- {n}: {s}" for n, s in context_summaries
-            )
-        else:
-            context_so_far = ""
-
-        theory_units_compact = _compact_theory_units_for_section(theory_units or [], key)
-        genealogy_excerpt = _genealogy_excerpt_for_section(theory_genealogy or {}, key)
-
-        section_text = _generate_section(
+    if _is_trivial_corpus(papers, clusters, theory_units):
+        return _fallback_report(evidence, on_section)
+
+    shared_evidence_json = _shared_evidence_json(evidence)
+    fragments = _encode_evidence_fragments(evidence)
+    section_json = {key: _section_evidence_json(key, fragments) for key, _ in SECTION_SPECS}
+    theory_units_json = _theory_units_json(theory_units or [])
+    genealogy_excerpts = _genealogy_excerpts(theory_genealogy or {})
+    limiter = _AdaptiveLimiter(max_parallel_requests)
+    fallback_text = _fallback_text(evidence)
+
+    def generate(
+        key: str,
+        name: str,
+        context_so_far: str,
+        fallback: str,
+        on_summary: Callable[[str], None] | None = None,
+    ) -> str:
+        return _generate_section(
             section_key=key,
             section_name=name,
-            evidence=evidence,
+            fallback_text=fallback,
+            shared_evidence_json=shared_evidence_json,
+            section_evidence_json=section_json[key],
             context_so_far=context_so_far,
-            theory_units_compact=theory_units_compact,
-            genealogy_excerpt=genealogy_excerpt,
+            theory_units_json=theory_units_json[key],
+            genealogy_excerpt=genealogy_excerpts[key],
             llm_model=llm_model,
             client=client,
+            cache_dir=cache_dir,
+            limiter=limiter,
+            on_summary=on_summary,
+        )
+
+    if overlap_sections:
+        return _generate_sections_overlapped(
+            lambda key, name, context_so_far, on_summary: generate(
+                key, name, context_so_far, fallback_text, on_summary
+            ),
+            on_section,
         )
+
+    if max_parallel_requests > 1:
+        workers = min(max_parallel_requests, len(SECTION_SPECS))
+        # Longest-processing-time-first: start the long sections before the short ones
+        # so a bounded pool does not end on a single straggler.
+        schedule = sorted(
+            SECTION_SPECS,
+            key=lambda spec: _expected_section_cost(spec[0], section_json[spec[0]]),
+            reverse=True,
+        )
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            drafts = _gather_sections(
+                pool,
+                schedule,
+                lambda key, name: generate(key, name, "", fallback_text),
+                None if cross_revise else on_section,
+            )
+            if not cross_revise:
+                return drafts
+
+            summaries = {key: f"- {name}: {_section_summary(drafts[key])}" for key, name in SECTION_SPECS}
+            return _gather_sections(
+                pool,
+                schedule,
+                lambda key, name: generate(
+                    key,
+                    name,
+                    "\n".join(line for other, line in summaries.items() if other != key),
+                    drafts[key],
+                ),
+                on_section,
+            )
+
+    payload: dict[str, Any] = {}
+    # Accumulated context from previously written sections (brief summary per section),
+    # extended in place rather than re-joined for every section
+    context_so_far = ""
+    for key, name in SECTION_SPECS:
+        section_text = generate(key, name, context_so_far, fallback_text)
         payload[key] = section_text
+        if on_section is not None:
+            on_section(key, section_text)
 
-        # Accumulate: first 250 chars as a summary tag for next sections
-        summary = section_text.replace("\n", " ").strip()[:250]
-        context_summaries.append((name, summary + ("..." if len(section_text) > 250 else "")))
+        # Accumulate: a short summary tag for next sections
+        summary_line = f"- {name}: {_section_summary(section_text)}"
+        context_so_far = f"{context_so_far}\n{summary_line}" if context_so_far else summary_line
 
     return payload
+
+
+def _parse_batched_sections(response: str) -> dict[str, str] | None:
+    """Split a batched response on its section markers; None unless every section has a body."""
+    bodies = {key: body for key, body in BATCHED_SECTION_PATTERN.findall(response) if body}
+    missing = [key for key, _ in SECTION_SPECS if key not in bodies]
+    if missing:
+        # Usually a reply cut off by the model's context window (num_ctx), which drops the trailing sections
+        LOGGER.warning("Batched synthesis response lacks sections: %s", ", ".join(missing))
+        return None
+    return {key: bodies[key] for key, _ in SECTION_SPECS}
+
+
+def synthesize_field_report_batched(
+    papers: list[dict],
+    clusters: list[dict],
+    llm_model: str,
+    client: OllamaClient,
+    concept_method_kb: dict[str, Any] | None = None,
+    theory_units: list[dict] | None = None,
+    theory_genealogy: dict | None = None,
+    cache_dir: Path | None = None,
+    on_section: Callable[[str, str], None] | None = None,
+    **section_kwargs: Any,
+) -> dict[str, Any]:
+    """Generate every report section with a single LLM call.
+
+    The evidence is sent once and the model writes all sections between
+    ``[SECTION:key]`` / ``[/SECTION:key]`` markers, trading eight prefills and
+    round-trips for one long generation. Sections lose the rolling context of the
+    sequential path but see each other in the same output. If the call fails or
+    any section is missing from the response, this falls back to
+    ``synthesize_field_report`` (``section_kwargs`` are passed through to it).
+    """
+    evidence = _build_evidence_index(
+        papers,
+        clusters,
+        concept_method_kb=concept_method_kb,
+        theory_units=theory_units,
+        theory_genealogy=theory_genealogy,
+    )
+    if _is_trivial_corpus(papers, clusters, theory_units):
+        return _fallback_report(evidence, on_section)
+
+    fragments = _encode_evidence_fragments(evidence)
+    section_specs = "\n\n".join(
+        f"[SECTION:{key}] {name} (target: {word_target})\n{instructions}"
+        for key, (name, instructions, word_target) in SECTION_SPEC_TABLE.items()
+    )
+    prompt = BATCHED_SYNTHESIS_USER_TEMPLATE.format(
+        shared_evidence_json=_shared_evidence_json(evidence),
+        theory_units_json=json.dumps(_project_theory_units(theory_units or [], "full"), ensure_ascii=False),
+        genealogy_excerpt=_genealogy_excerpt(theory_genealogy or {}, "full"),
+        evidence_json=_evidence_bundle_json(BATCHED_EVIDENCE_FIELDS, fragments),
+        section_specs=section_specs,
+    )
+
+    cache_path = _section_cache_path(cache_dir, llm_model, prompt) if cache_dir else None
+    sections = None
+    cached = _read_cache_entry(cache_path, "batched synthesis") if cache_path is not None else None
+    if cached is not None:
+        LOGGER.info("Batched synthesis cache hit: %s", cache_path.name)
+        sections = _parse_batched_sections(cached)
+    if sections is None:
+        try:
+            response = "".join(
+                client.chat_stream(
+                    model=llm_model,
+                    system=SECTION_SYNTHESIS_SYSTEM_PROMPT,
+                    user=prompt,
+                    temperature=0.2,
+                    timeout=1800,
+                    num_predict=BATCHED_SYNTHESIS_NUM_PREDICT,
+                )
+            )
+            sections = _parse_batched_sections(response)
+        except Exception as exc:
+            LOGGER.warning("Batched synthesis failed: %s: %s", type(exc).__name__, exc)
+        else:
+            if sections is not None and cache_path is not None:
+                _write_cache_entry(cache_path, response, "batched synthesis")
+
+    if sections is None:
+        LOGGER.warning("Batched synthesis response incomplete; generating sections one by one")
+        return synthesize_field_report(
+            papers,
+            clusters,
+            llm_model,
+            client,
+            concept_method_kb=concept_method_kb,
+            theory_units=theory_units,
+            theory_genealogy=theory_genealogy,
+            cache_dir=cache_dir,
+            on_section=on_section,
+            **section_kwargs,
+        )
+
+    if on_section is not None:
+        for key, text in sections.items():
+            on_section(key, text)
+    return sections
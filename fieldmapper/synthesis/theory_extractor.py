@@ -2,9 +2,17 @@ from __future__ import annotations
 
 import json
 import logging
+import re
+import threading
 from collections import Counter
-from typing import Any
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from itertools import takewhile
+from pathlib import Path
+from typing import Any, TypeVar
 
+from fieldmapper.extraction.llm_cache import llm_cache_path
 from fieldmapper.extraction.ollama_client import OllamaClient
 from fieldmapper.extraction.prompts import (
     THEORY_GENEALOGY_SYSTEM_PROMPT,
@@ -12,27 +20,223 @@ from fieldmapper.extraction.prompts import (
     THEORY_UNIT_EXTRACTION_SYSTEM_PROMPT,
     THEORY_UNIT_EXTRACTION_USER_TEMPLATE,
 )
+from fieldmapper.io_utils import list_head, write_text_atomic
 
 LOGGER = logging.getLogger(__name__)
 
+THINK_BLOCK_PATTERN = re.compile(r"^\s*<think>.*?</think>", re.DOTALL)
+JSON_START_PATTERN = re.compile(r"[{\[]")
+JSON_STRUCTURE_PATTERN = re.compile(r'[{}\[\]"\\]')
+
+# LLM attempts per JSON stage; retries append the stage's strict-JSON reminder
+JSON_MAX_ATTEMPTS = 3
+THEORY_UNITS_STRICT_SUFFIX = (
+    "\n\nIMPORTANT: Your previous output was invalid JSON. "
+    "Return STRICT valid JSON array only, with double quotes on all keys/strings."
+)
+GENEALOGY_STRICT_SUFFIX = (
+    "\n\nIMPORTANT: Your previous output was invalid JSON. "
+    "Return STRICT valid JSON with keys: narrative, causal_chains, dominant_paradigm_shifts."
+)
+
+T = TypeVar("T")
+
+
+def _strip_think_block(text: str) -> str:
+    """Drop a leading ``<think>...</think>`` block that reasoning models emit before the answer."""
+    return THINK_BLOCK_PATTERN.sub("", text, count=1)
+
 
 def _extract_json_blob(text: str) -> str:
     """Extract the first valid JSON object or array from arbitrary model output."""
-    text = text.strip()
+    text = _strip_think_block(text).strip()
     if not text:
         raise ValueError("Empty model response")
     decoder = json.JSONDecoder()
-    for idx, ch in enumerate(text):
-        if ch not in ("{", "["):
-            continue
+    # Decode in place from each candidate opener instead of slicing a copy of the tail
+    for match in JSON_START_PATTERN.finditer(text):
+        start = match.start()
         try:
-            _, end = decoder.raw_decode(text[idx:])
-            return text[idx : idx + end]
+            _, end = decoder.raw_decode(text, start)
         except json.JSONDecodeError:
             continue
+        return text[start:end]
     raise ValueError("No valid JSON object or array found in model response")
 
 
+def _read_json_response(chunks: Iterable[str]) -> str:
+    """Accumulate a streamed model response, stopping once its first JSON value has closed.
+
+    A single pass tracks bracket depth (ignoring brackets inside strings) from the
+    first ``{``/``[`` after any leading think block. When the depth returns to zero
+    and that span is valid JSON, the rest of the generation is not waited for.
+    Otherwise the whole response is read and left to ``_extract_json_blob``.
+    """
+    text = ""
+    pos = 0
+    start = -1
+    depth = 0
+    in_string = False
+    escaped = False
+    scanning = True
+    thinking: bool | None = None  # unknown until the response's first characters arrive
+    for chunk in chunks:
+        text += chunk
+        if not scanning:
+            continue
+        if thinking is None:
+            head = text.lstrip()
+            if len(head) < len("<think>") and "<think>".startswith(head):
+                continue
+            thinking = head.startswith("<think>")
+        if thinking:
+            close = text.find("</think>", max(0, pos - len("</think>")))
+            if close < 0:
+                pos = len(text)
+                continue
+            pos = close + len("</think>")
+            thinking = False
+        while pos < len(text):
+            if start < 0:
+                match = JSON_START_PATTERN.search(text, pos)
+                if match is None:
+                    pos = len(text)
+                    break
+                start = match.start()
+                depth = 1
+                pos = match.end()
+                continue
+            if escaped:
+                # The escaped character can't close a string or a bracket
+                escaped = False
+                pos += 1
+                continue
+            # Jump straight to the next structural character instead of stepping through each one
+            match = JSON_STRUCTURE_PATTERN.search(text, pos)
+            if match is None:
+                pos = len(text)
+                break
+            ch = match.group()
+            pos = match.end()
+            if in_string:
+                if ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in "{[":
+                depth += 1
+            elif ch in "}]":
+                depth -= 1
+                if depth == 0:
+                    try:
+                        json.loads(text[start:pos])
+                    except json.JSONDecodeError:
+                        scanning = False
+                        break
+                    return text[:pos]
+    return text
+
+
+def _chat_json_text(
+    client: OllamaClient,
+    llm_model: str,
+    system: str,
+    user: str,
+    temperature: float,
+    stop: threading.Event | None = None,
+) -> str:
+    """Stream a chat completion and return it as soon as the JSON answer is complete.
+
+    Setting ``stop`` abandons the stream (and with it the generation) at the next chunk.
+    """
+    with closing(
+        client.chat_stream(model=llm_model, system=system, user=user, temperature=temperature, timeout=1800)
+    ) as chunks:
+        if stop is None:
+            return _read_json_response(chunks)
+        return _read_json_response(takewhile(lambda _chunk: not stop.is_set(), chunks))
+
+
+def _chat_json_with_retries(
+    client: OllamaClient,
+    llm_model: str,
+    system: str,
+    user_prompt: str,
+    strict_suffix: str,
+    temperature: float,
+    parse: Callable[[str], T | None],
+    speculative: bool = False,
+    cache_dir: Path | None = None,
+) -> tuple[T | None, list[str]]:
+    """Ask for JSON up to JSON_MAX_ATTEMPTS times; return the first parsed result and the attempt errors.
+
+    Retries append ``strict_suffix`` to the prompt. ``parse`` raises (or returns None)
+    for unusable replies. With ``speculative`` the first retry is not left to wait for
+    the first attempt: both run concurrently, the first usable reply wins and the
+    other stream is abandoned. This only pays off when the Ollama server runs
+    requests in parallel and first replies are often malformed.
+
+    With ``cache_dir`` the first reply that parses is stored under a hash of model,
+    temperature, system prompt and the base user prompt, and an identical later call
+    returns it without contacting the LLM. Replies that fail to parse are never cached.
+    """
+    cache_path = (
+        llm_cache_path(cache_dir, llm_model, str(temperature), system, user_prompt) if cache_dir else None
+    )
+    if cache_path is not None and cache_path.exists():
+        try:
+            result = parse(cache_path.read_text(encoding="utf-8"))
+        except Exception as exc:
+            LOGGER.warning("Ignoring unreadable LLM cache entry %s: %s", cache_path.name, exc)
+        else:
+            if result is not None:
+                LOGGER.info("LLM cache hit: %s", cache_path.name)
+                return result, []
+
+    prompts = [user_prompt] + [user_prompt + strict_suffix] * (JSON_MAX_ATTEMPTS - 1)
+    errors: list[str] = []
+
+    def attempt(number: int, stop: threading.Event | None = None) -> T | None:
+        try:
+            raw = _chat_json_text(client, llm_model, system, prompts[number - 1], temperature, stop)
+            result = parse(raw)
+        except Exception as exc:
+            if stop is None or not stop.is_set():
+                errors.append(f"attempt_{number}: {type(exc).__name__}: {exc}")
+            return None
+        if result is not None and cache_path is not None:
+            # Best-effort: an unwritable cache must not discard a reply that already parsed
+            try:
+                write_text_atomic(cache_path, raw)
+            except OSError as exc:
+                LOGGER.warning("Could not write LLM cache entry %s: %s", cache_path, exc)
+        return result
+
+    next_attempt = 1
+    if speculative and len(prompts) > 1:
+        stop = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=2)
+        try:
+            futures = [pool.submit(attempt, number, stop) for number in (1, 2)]
+            for future in as_completed(futures):
+                result = future.result()
+                if result is not None:
+                    return result, errors
+        finally:
+            # Don't wait for the losing attempt; it drops its stream at the next chunk
+            stop.set()
+            pool.shutdown(wait=False)
+        next_attempt = 3
+
+    for number in range(next_attempt, len(prompts) + 1):
+        result = attempt(number)
+        if result is not None:
+            return result, errors
+    return None, errors
+
+
 def _compact_papers(papers: list[dict], limit: int = 30) -> list[dict]:
     out = []
     for paper in papers[:limit]:
@@ -44,8 +248,8 @@ def _compact_papers(papers: list[dict], limit: int = 30) -> list[dict]:
                 "paper_type": paper.get("paper_type", ""),
                 "core_problem": paper.get("core_problem", ""),
                 "main_claim": paper.get("main_claim", ""),
-                "theoretical_framework": list(paper.get("theoretical_framework", []))[:6],
-                "key_concepts": list(paper.get("key_concepts", []))[:6],
+                "theoretical_framework": list_head(paper.get("theoretical_framework"), 6),
+                "key_concepts": list_head(paper.get("key_concepts"), 6),
             }
         )
     return out
@@ -59,18 +263,37 @@ def _compact_clusters(clusters: list[dict], limit: int = 20) -> list[dict]:
                 "cluster_id": cluster.get("cluster_id", ""),
                 "representative_label": cluster.get("representative_label", ""),
                 "paper_count": cluster.get("paper_count", 0),
-                "concepts": list(cluster.get("concepts", []))[:12],
+                "concepts": list_head(cluster.get("concepts"), 12),
             }
         )
     return out
 
 
+def _cluster_id(value: Any) -> int | None:
+    """Coerce an LLM-supplied cluster id to a non-negative int; None for anything else.
+
+    JSON numbers pass through without a string round-trip and decimal strings are
+    parsed. Booleans and floats are rejected, and so are negatives: cluster ids are
+    the connected-component clusters' list positions, so a negative id can only be
+    invalid model output.
+    """
+    if type(value) is int:
+        return value if value >= 0 else None
+    if isinstance(value, str) and value.isdecimal():
+        return int(value)
+    return None
+
+
 def _normalize_theory_unit(raw: Any, idx: int) -> dict[str, Any]:
     if not isinstance(raw, dict):
         return {}
+    # Entries with a blank name are discarded by the caller; skip building the rest
+    name = str(raw.get("name", f"Theory {idx}")).strip()
+    if not name:
+        return {}
     return {
         "theory_id": f"theory_{idx:03d}",
-        "name": str(raw.get("name", f"Theory {idx}")).strip(),
+        "name": name,
         "origin_problem": str(raw.get("origin_problem", "")).strip(),
         "core_mechanism": str(raw.get("core_mechanism", "")).strip(),
         "predecessor_theories": [str(x) for x in raw.get("predecessor_theories", []) if x],
@@ -80,16 +303,37 @@ def _normalize_theory_unit(raw: Any, idx: int) -> dict[str, Any]:
         "successor_or_revision": str(raw.get("successor_or_revision", "")).strip(),
         "current_status": str(raw.get("current_status", "unknown")).strip(),
         "paper_anchors": [str(x) for x in raw.get("paper_anchors", []) if x],
-        "cluster_ids": [int(x) for x in raw.get("cluster_ids", []) if str(x).isdigit()],
+        "cluster_ids": [cid for cid in map(_cluster_id, raw.get("cluster_ids", [])) if cid is not None],
     }
 
 
+def _parse_theory_units(raw: str) -> list[dict[str, Any]] | None:
+    parsed = json.loads(_extract_json_blob(raw))
+
+    # Accept both a bare array and a {"theories": [...]} wrapper
+    if isinstance(parsed, dict):
+        for key in ("theories", "theory_units", "results"):
+            if isinstance(parsed.get(key), list):
+                parsed = parsed[key]
+                break
+
+    if not isinstance(parsed, list):
+        return None
+    return [
+        u
+        for u in (_normalize_theory_unit(item, i + 1) for i, item in enumerate(parsed))
+        if u
+    ]
+
+
 def extract_theory_units(
     papers: list[dict],
     clusters: list[dict],
     concept_method_kb: dict[str, Any],
     client: OllamaClient,
     llm_model: str,
+    speculative_retry: bool = False,
+    cache_dir: Path | None = None,
 ) -> list[dict[str, Any]]:
     """Stage A: Identify and reconstruct discrete theory units from the corpus."""
     clusters_compact = _compact_clusters(clusters)
@@ -102,43 +346,20 @@ def extract_theory_units(
         papers_compact_json=json.dumps(papers_compact, ensure_ascii=False),
     )
 
-    errors: list[str] = []
-    for attempt in range(1, 4):
-        prompt = user_prompt
-        if attempt > 1:
-            prompt += (
-                "\n\nIMPORTANT: Your previous output was invalid JSON. "
-                "Return STRICT valid JSON array only, with double quotes on all keys/strings."
-            )
-        try:
-            raw = client.chat(
-                model=llm_model,
-                system=THEORY_UNIT_EXTRACTION_SYSTEM_PROMPT,
-                user=prompt,
-                temperature=0.1,
-                timeout=1800,
-            )
-            blob = _extract_json_blob(raw)
-            parsed = json.loads(blob)
-
-            # Accept both a bare array and a {"theories": [...]} wrapper
-            if isinstance(parsed, dict):
-                for key in ("theories", "theory_units", "results"):
-                    if isinstance(parsed.get(key), list):
-                        parsed = parsed[key]
-                        break
-
-            if isinstance(parsed, list):
-                units = [
-                    u
-                    for u in (_normalize_theory_unit(item, i + 1) for i, item in enumerate(parsed))
-                    if u.get("name")
-                ]
-                LOGGER.info("Extracted %d theory units", len(units))
-                return units
-
-        except Exception as exc:
-            errors.append(f"attempt_{attempt}: {type(exc).__name__}: {exc}")
+    units, errors = _chat_json_with_retries(
+        client,
+        llm_model,
+        THEORY_UNIT_EXTRACTION_SYSTEM_PROMPT,
+        user_prompt,
+        THEORY_UNITS_STRICT_SUFFIX,
+        temperature=0.1,
+        parse=_parse_theory_units,
+        speculative=speculative_retry,
+        cache_dir=cache_dir,
+    )
+    if units is not None:
+        LOGGER.info("Extracted %d theory units", len(units))
+        return units
 
     LOGGER.warning("Theory unit extraction failed after retries: %s", " | ".join(errors))
     return []
@@ -156,22 +377,38 @@ def _normalize_causal_chain(raw: Any) -> dict[str, str]:
     }
 
 
+def _parse_genealogy(raw: str) -> dict[str, Any] | None:
+    parsed = json.loads(_extract_json_blob(raw))
+    if not isinstance(parsed, dict):
+        return None
+
+    chains = [
+        c
+        for c in (_normalize_causal_chain(x) for x in parsed.get("causal_chains", []))
+        if c.get("from_theory") or c.get("to_theory")
+    ]
+    shifts = [str(x).strip() for x in parsed.get("dominant_paradigm_shifts", []) if x]
+    return {
+        "narrative": str(parsed.get("narrative", "")).strip(),
+        "causal_chains": chains,
+        "dominant_paradigm_shifts": shifts,
+    }
+
+
 def build_theory_genealogy(
     theory_units: list[dict[str, Any]],
     papers: list[dict],
     client: OllamaClient,
     llm_model: str,
+    speculative_retry: bool = False,
+    cache_dir: Path | None = None,
 ) -> dict[str, Any]:
     """Stage B: Reconstruct the causal genealogy of theoretical development."""
     if not theory_units:
         LOGGER.warning("No theory units provided; skipping genealogy construction.")
         return {"narrative": "", "causal_chains": [], "dominant_paradigm_shifts": []}
 
-    year_counter: Counter = Counter()
-    for paper in papers:
-        year = str(paper.get("year", "")).strip()
-        if year:
-            year_counter[year] += 1
+    year_counter = Counter(year for paper in papers if (year := str(paper.get("year", "")).strip()))
     timeline = [{"year": y, "paper_count": c} for y, c in sorted(year_counter.items())]
 
     user_prompt = THEORY_GENEALOGY_USER_TEMPLATE.format(
@@ -179,47 +416,25 @@ def build_theory_genealogy(
         timeline_json=json.dumps(timeline, ensure_ascii=False),
     )
 
-    errors: list[str] = []
-    for attempt in range(1, 4):
-        prompt = user_prompt
-        if attempt > 1:
-            prompt += (
-                "\n\nIMPORTANT: Your previous output was invalid JSON. "
-                "Return STRICT valid JSON with keys: narrative, causal_chains, dominant_paradigm_shifts."
-            )
-        try:
-            raw = client.chat(
-                model=llm_model,
-                system=THEORY_GENEALOGY_SYSTEM_PROMPT,
-                user=prompt,
-                temperature=0.15,
-                timeout=1800,
-            )
-            blob = _extract_json_blob(raw)
-            parsed = json.loads(blob)
-
-            if isinstance(parsed, dict):
-                chains = [
-                    c
-                    for c in (_normalize_causal_chain(x) for x in parsed.get("causal_chains", []))
-                    if c.get("from_theory") or c.get("to_theory")
-                ]
-                shifts = [str(x).strip() for x in parsed.get("dominant_paradigm_shifts", []) if x]
-                result = {
-                    "narrative": str(parsed.get("narrative", "")).strip(),
-                    "causal_chains": chains,
-                    "dominant_paradigm_shifts": shifts,
-                }
-                LOGGER.info(
-                    "Built theory genealogy: %d causal chains, %d paradigm shifts, narrative %d chars",
-                    len(result["causal_chains"]),
-                    len(result["dominant_paradigm_shifts"]),
-                    len(result["narrative"]),
-                )
-                return result
-
-        except Exception as exc:
-            errors.append(f"attempt_{attempt}: {type(exc).__name__}: {exc}")
+    result, errors = _chat_json_with_retries(
+        client,
+        llm_model,
+        THEORY_GENEALOGY_SYSTEM_PROMPT,
+        user_prompt,
+        GENEALOGY_STRICT_SUFFIX,
+        temperature=0.15,
+        parse=_parse_genealogy,
+        speculative=speculative_retry,
+        cache_dir=cache_dir,
+    )
+    if result is not None:
+        LOGGER.info(
+            "Built theory genealogy: %d causal chains, %d paradigm shifts, narrative %d chars",
+            len(result["causal_chains"]),
+            len(result["dominant_paradigm_shifts"]),
+            len(result["narrative"]),
+        )
+        return result
 
     LOGGER.warning("Theory genealogy building failed: %s", " | ".join(errors))
     return {"narrative": "", "causal_chains": [], "dominant_paradigm_shifts": []}
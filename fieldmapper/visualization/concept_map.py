@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
 import json
+from collections import defaultdict
+from itertools import cycle, islice
 from pathlib import Path
 
-import networkx as nx
+import numpy as np
 
 
+# zlib level for the static PNG; 3 encodes faster than matplotlib's default 6 and compresses this figure better
+PNG_COMPRESS_LEVEL = 3
+
+# Above this many edges the HTML map keeps only each node's strongest links; SVG slows down past a few thousand lines
+HTML_EDGE_PRUNE_THRESHOLD = 5000
+
 _PALETTE: list[str] = [
     "#4e79a7", "#f28e2b", "#e15759", "#76b7b2", "#59a14f",
     "#edc948", "#b07aa1", "#ff9da7", "#9c755f", "#a9cce3",
@@ -245,12 +255,19 @@ _CONCEPT_MAP_HTML_TEMPLATE = """<!doctype html>
 <script type="module">
 import * as d3 from "https://cdn.jsdelivr.net/npm/d3@7/+esm";
 
-const raw = __PAYLOAD_JSON__;
+// The payload arrives as a JSON string: JSON.parse is much cheaper for engines than a large object literal
+const raw = JSON.parse(__PAYLOAD_JSON__);
 const nodes = raw.nodes.map(n => ({...n}));
-const links = raw.edges.map(e => ({
-  id: e.id, source: e.source, target: e.target, weight: e.weight,
+const links = raw.edges.source.map((source, i) => ({
+  id: i, source, target: raw.edges.target[i], weight: raw.edges.weight[i],
 }));
 const nodeById = new Map(nodes.map(n => [n.id, n]));
+// Incident links per node id, built once from the string ids before d3 swaps in node objects
+const adjacency = new Map(nodes.map(n => [n.id, []]));
+links.forEach(link => {
+  adjacency.get(link.source)?.push({link, other: link.target});
+  adjacency.get(link.target)?.push({link, other: link.source});
+});
 const maxWeight = d3.max(links, d => d.weight) || 1;
 
 // --- SVG setup ---
@@ -272,6 +289,20 @@ function updateLabelVisibility() {
   });
 }
 
+// --- Position cache ---
+// Settled positions are kept for the tab session, so a reload resumes the layout instead of rerunning it
+const positionsKey = "concept-map:" + location.pathname + ":" + raw.graph_key;
+let cachedPositions = null;
+try { cachedPositions = JSON.parse(sessionStorage.getItem(positionsKey) || "null"); } catch (e) {}
+const restored = !!cachedPositions && nodes.every(n => Array.isArray(cachedPositions[n.id]));
+if (restored) nodes.forEach(n => { [n.x, n.y] = cachedPositions[n.id]; });
+
+function savePositions() {
+  try {
+    sessionStorage.setItem(positionsKey, JSON.stringify(Object.fromEntries(nodes.map(n => [n.id, [n.x, n.y]]))));
+  } catch (e) {}
+}
+
 // --- Force simulation ---
 const simulation = d3.forceSimulation(nodes)
   .alphaDecay(0.013)
@@ -284,8 +315,12 @@ const simulation = d3.forceSimulation(nodes)
   .force("charge", d3.forceManyBody().strength(d => -100 - d.r * 8))
   .force("center", d3.forceCenter(0, 0).strength(0.04))
   .force("collide", d3.forceCollide(d => d.r + 8));
+// Restored positions are already settled: a short cool-down is enough
+if (restored) simulation.alpha(0.002);
 
 // --- Edges ---
+// Edges have no handlers; keeping them out of hit-testing saves the browser a pass over every line on pointer moves
+edgesG.style("pointer-events", "none");
 const edgeSel = edgesG.selectAll("line")
   .data(links)
   .join("line")
@@ -365,6 +400,7 @@ simulation.on("tick", () => {
 simulation.on("end", () => {
   document.getElementById("hud-dot").classList.add("settled");
   document.getElementById("hud-text").textContent = "Settled";
+  savePositions();
   if (!userHasZoomed) fitGraph();
 });
 
@@ -427,13 +463,11 @@ function clearSelection() {
 
 function selectNode(d) {
   selectedId = d.id;
+  const incident = adjacency.get(d.id) || [];
+  const incidentIds = new Set(incident.map(a => a.link.id));
   const neighborIds = new Set();
-  links.forEach(l => {
-    if (hiddenEdges.has(l.id)) return;
-    const sid = l.source.id !== undefined ? l.source.id : l.source;
-    const tid = l.target.id !== undefined ? l.target.id : l.target;
-    if (sid === d.id) neighborIds.add(tid);
-    else if (tid === d.id) neighborIds.add(sid);
+  incident.forEach(({link, other}) => {
+    if (!hiddenEdges.has(link.id)) neighborIds.add(other);
   });
 
   nodeSel
@@ -449,18 +483,12 @@ function selectNode(d) {
 
   edgeSel
     .attr("display", l => hiddenEdges.has(l.id) ? "none" : null)
-    .attr("stroke", l => {
-      if (hiddenEdges.has(l.id)) return "#162840";
-      const sid = l.source.id !== undefined ? l.source.id : l.source;
-      const tid = l.target.id !== undefined ? l.target.id : l.target;
-      return (sid === d.id || tid === d.id) ? "#8b5cf6" : "#162840";
-    })
-    .attr("stroke-opacity", l => {
-      if (hiddenEdges.has(l.id)) return 0;
-      const sid = l.source.id !== undefined ? l.source.id : l.source;
-      const tid = l.target.id !== undefined ? l.target.id : l.target;
-      return (sid === d.id || tid === d.id) ? 0.9 : 0.05;
-    });
+    .attr("stroke", l =>
+      !hiddenEdges.has(l.id) && incidentIds.has(l.id) ? "#8b5cf6" : "#162840"
+    )
+    .attr("stroke-opacity", l =>
+      hiddenEdges.has(l.id) ? 0 : incidentIds.has(l.id) ? 0.9 : 0.05
+    );
 
   labelSel.attr("fill", nd =>
     nd.id === d.id || neighborIds.has(nd.id) ? "#f0f9ff" : "#2d3f55"
@@ -471,7 +499,7 @@ function selectNode(d) {
   document.getElementById("node-detail").textContent =
     "paper_count: " + d.paper_count +
     "\\nconnected: " + neighborIds.size +
-    "\\nconcepts: " + ((d.concepts || []).slice(0, 10).join(", ") || "n/a");
+    "\\nconcepts: " + ((d.concepts || []).join(", ") || "n/a");
   document.getElementById("neighbor-list").textContent =
     [...neighborIds].map(id => nodeById.get(id)?.label || id).join("\\n") ||
     "No connected nodes above threshold.";
@@ -483,20 +511,14 @@ const sliderVal = document.getElementById("edge-weight-value");
 const allMaxW = d3.max(links, l => l.weight) || 1;
 slider.max = String(allMaxW);
 
-slider.addEventListener("input", e => {
-  const minW = Number(e.target.value);
+function applyEdgeFilter(minW) {
   sliderVal.textContent = String(minW);
   hiddenEdges.clear();
   hiddenNodes.clear();
   links.forEach(l => { if (l.weight < minW) hiddenEdges.add(l.id); });
   if (links.length) {
     nodes.forEach(n => {
-      const vis = links.some(l => {
-        if (hiddenEdges.has(l.id)) return false;
-        const sid = l.source.id !== undefined ? l.source.id : l.source;
-        const tid = l.target.id !== undefined ? l.target.id : l.target;
-        return sid === n.id || tid === n.id;
-      });
+      const vis = adjacency.get(n.id).some(({link}) => !hiddenEdges.has(link.id));
       if (!vis) hiddenNodes.add(n.id);
     });
   }
@@ -510,6 +532,16 @@ slider.addEventListener("input", e => {
   } else {
     updateLabelVisibility();
   }
+}
+
+// A fast drag fires many input events per frame; filter at most once per frame, with the latest value
+let sliderFrame = 0;
+slider.addEventListener("input", () => {
+  if (sliderFrame) return;
+  sliderFrame = requestAnimationFrame(() => {
+    sliderFrame = 0;
+    applyEdgeFilter(Number(slider.value));
+  });
 });
 
 // --- Legend (all nodes, searchable) ---
@@ -559,88 +591,137 @@ updateLabelVisibility();
 </body>
 </html>"""
 
+# Split once at import so rendering writes head, payload and tail without a marker scan
+_CONCEPT_MAP_HTML_HEAD, _CONCEPT_MAP_HTML_TAIL = _CONCEPT_MAP_HTML_TEMPLATE.split("__PAYLOAD_JSON__", 1)
+
 
 def render_concept_map(clusters: list[dict], edges: list[dict], output_path: Path) -> None:
-    import matplotlib.pyplot as plt
+    import networkx as nx
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
 
     graph = nx.Graph()
-
-    for c in clusters:
-        graph.add_node(
-            c["cluster_id"],
-            label=c["representative_label"],
-            size=max(300, c["paper_count"] * 280),
-        )
-
+    node_ids = [c["cluster_id"] for c in clusters]
+    graph.add_nodes_from(node_ids)
+    # Same rules as the HTML map: ids compare as strings, edges to unknown clusters and
+    # self-loops are dropped, and the first weight listed for a pair wins
+    node_by_key = {str(cid): cid for cid in node_ids}
     for edge in edges:
-        graph.add_edge(edge["source"], edge["target"], weight=edge["weight"])
-
-    plt.figure(figsize=(14, 10))
+        source_key, target_key = str(edge["source"]), str(edge["target"])
+        if source_key == target_key or source_key not in node_by_key or target_key not in node_by_key:
+            continue
+        source, target = node_by_key[source_key], node_by_key[target_key]
+        if not graph.has_edge(source, target):
+            graph.add_edge(source, target, weight=edge.get("weight", 1))
+
+    # A bare Agg figure: no pyplot state machine or GUI backend, and nothing to close afterwards
+    fig = Figure(figsize=(14, 10))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
     pos = nx.spring_layout(graph, seed=7, k=1.2)
 
-    node_sizes = [graph.nodes[n]["size"] for n in graph.nodes]
-    weights = [graph.edges[e]["weight"] for e in graph.edges] if graph.edges else []
+    node_sizes = np.maximum(300, np.array([c["paper_count"] for c in clusters], dtype=np.int64) * 280)
 
-    nx.draw_networkx_nodes(graph, pos, node_size=node_sizes, node_color="#0ea5e9", alpha=0.9)
+    nx.draw_networkx_nodes(graph, pos, nodelist=node_ids, node_size=node_sizes, node_color="#0ea5e9", alpha=0.9, ax=ax)
     if graph.edges:
+        weights = np.fromiter((w for _, _, w in graph.edges(data="weight")), dtype=np.float64, count=len(graph.edges))
         nx.draw_networkx_edges(
             graph,
             pos,
-            width=[1 + w * 0.8 for w in weights],
+            width=1 + weights * 0.8,
             edge_color="#64748b",
             alpha=0.55,
+            ax=ax,
         )
 
-    labels = {n: graph.nodes[n]["label"] for n in graph.nodes}
-    nx.draw_networkx_labels(graph, pos, labels=labels, font_size=9, font_color="#0f172a")
+    labels = {c["cluster_id"]: c["representative_label"] for c in clusters}
+    nx.draw_networkx_labels(graph, pos, labels=labels, font_size=9, font_color="#0f172a", ax=ax)
 
-    plt.title("FieldMapper Concept Map", fontsize=16)
-    plt.axis("off")
+    ax.set_title("FieldMapper Concept Map", fontsize=16)
+    ax.set_axis_off()
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=220)
-    plt.close()
-
-
-def render_concept_map_html(clusters: list[dict], edges: list[dict], output_path: Path) -> None:
-    nodes_payload: list[dict] = []
-    for i, c in enumerate(clusters):
-        color = _PALETTE[i % len(_PALETTE)]
-        paper_count = int(c.get("paper_count", 1))
-        nodes_payload.append(
-            {
-                "id": str(c["cluster_id"]),
-                "label": c["representative_label"],
-                "r": max(8.0, min(30.0, 8.0 + paper_count * 1.4)),
-                "paper_count": paper_count,
-                "concepts": c.get("concepts", [])[:12],
-                "color": color,
-            }
-        )
-
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=220, pil_kwargs={"compress_level": PNG_COMPRESS_LEVEL})
+
+
+def _strongest_edges_per_node(edge_rows: list[tuple[str, str, int]], k: int) -> list[tuple[str, str, int]]:
+    """Keep (source, target, weight) rows ranked in the top ``k`` by weight at either endpoint.
+
+    One bounded min-heap per node makes this O(E log k). Ties keep the earlier edge,
+    and survivors stay in their original order.
+    """
+    heaps: dict[str, list[tuple[int, int]]] = defaultdict(list)
+    for idx, (source, target, weight) in enumerate(edge_rows):
+        item = (weight, -idx)
+        for node in (source, target):
+            heap = heaps[node]
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            else:
+                heapq.heappushpop(heap, item)
+    keep = {-neg_idx for heap in heaps.values() for _, neg_idx in heap}
+    return [row for idx, row in enumerate(edge_rows) if idx in keep]
+
+
+def render_concept_map_html(
+    clusters: list[dict],
+    edges: list[dict],
+    output_path: Path,
+    max_edges_per_node: int = 12,
+) -> None:
+    paper_counts = [int(c.get("paper_count", 1)) for c in clusters]
+    # Node radius grows with paper count, clamped to [8, 30]; one vectorized pass for all clusters
+    radii = np.clip(8.0 + np.asarray(paper_counts, dtype=np.float64) * 1.4, 8.0, 30.0).tolist()
+    colors = list(islice(cycle(_PALETTE), len(clusters)))
+    nodes_payload: list[dict] = [
+        {
+            "id": str(c["cluster_id"]),
+            "label": c["representative_label"],
+            "r": r,
+            "paper_count": paper_count,
+            # The details panel lists at most 10 concepts; don't ship the rest
+            "concepts": c.get("concepts", [])[:10],
+            "color": color,
+        }
+        for c, paper_count, r, color in zip(clusters, paper_counts, radii, colors)
+    ]
+
+    # d3.forceLink throws on an unknown endpoint id, which would leave the page blank
+    node_ids = {node["id"] for node in nodes_payload}
     seen_pairs: set[tuple[str, str]] = set()
-    edges_payload: list[dict] = []
-    for idx, edge in enumerate(edges, start=1):
+    edge_rows: list[tuple[str, str, int]] = []
+    for edge in edges:
         source = str(edge["source"])
         target = str(edge["target"])
-        if source == target:
+        if source == target or source not in node_ids or target not in node_ids:
             continue
-        pair: tuple[str, str] = (min(source, target), max(source, target))
+        # One comparison orders the pair; min()+max() did two calls and two comparisons
+        pair: tuple[str, str] = (source, target) if source < target else (target, source)
         if pair in seen_pairs:
             continue
         seen_pairs.add(pair)
-        edges_payload.append(
-            {
-                "id": f"e{idx}",
-                "source": source,
-                "target": target,
-                "weight": int(edge.get("weight", 1)),
-            }
-        )
-
-    payload = {"nodes": nodes_payload, "edges": edges_payload}
-    payload_json = json.dumps(payload, ensure_ascii=False)
+        edge_rows.append((source, target, int(edge.get("weight", 1))))
+
+    if len(edge_rows) > HTML_EDGE_PRUNE_THRESHOLD:
+        edge_rows = _strongest_edges_per_node(edge_rows, max_edges_per_node)
+
+    # Edges ship as parallel columns; the page rebuilds link objects and uses the index as edge id
+    sources, targets, weights = (list(column) for column in zip(*edge_rows)) if edge_rows else ([], [], [])
+    # Fingerprint of node ids and edges; the page keys saved positions on it so a regenerated map never inherits them
+    graph_key = hashlib.blake2b(
+        json.dumps([sorted(node_ids), edge_rows], separators=(",", ":")).encode("utf-8"), digest_size=8
+    ).hexdigest()
+    payload = {
+        "nodes": nodes_payload,
+        "edges": {"source": sources, "target": targets, "weight": weights},
+        "graph_key": graph_key,
+    }
+    payload_json = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    # Embed as a JS string literal for JSON.parse; "<\/" keeps labels from closing the script tag
+    payload_literal = json.dumps(payload_json, ensure_ascii=False).replace("</", "<\\/")
 
-    html = _CONCEPT_MAP_HTML_TEMPLATE.replace("__PAYLOAD_JSON__", payload_json)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(html, encoding="utf-8")
+    with output_path.open("w", encoding="utf-8") as handle:
+        handle.write(_CONCEPT_MAP_HTML_HEAD)
+        handle.write(payload_literal)
+        handle.write(_CONCEPT_MAP_HTML_TAIL)